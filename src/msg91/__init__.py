@@ -4,6 +4,8 @@ MSG91 Python Client library
 
 from msg91.client import Client
 from msg91.exceptions import APIError, AuthenticationError, MSG91Exception, ValidationError
+from msg91.resources.async_otp import AsyncOTPResource
+from msg91.resources.async_sms import AsyncSMSResource
 from msg91.resources.otp import OTPResource
 from msg91.resources.sms import SMSResource
 from msg91.resources.template import TemplateResource
@@ -18,5 +20,7 @@ __all__ = [
     "SMSResource",
     "TemplateResource",
     "OTPResource",
+    "AsyncSMSResource",
+    "AsyncOTPResource",
     "__version__",
 ]
@@ -0,0 +1,59 @@
+"""
+In-memory response cache for MSG91 report endpoints
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after ``ttl`` seconds
+
+    Args:
+        ttl: Seconds an entry stays fresh
+        maxsize: Maximum number of entries kept (default: 256)
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, stale: bool = False) -> Optional[Any]:
+        """
+        Return the cached value, or None if missing
+
+        Expired entries are kept until evicted so they can be revalidated;
+        they are only returned when ``stale`` is True.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if not stale and expires_at <= time.monotonic():
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
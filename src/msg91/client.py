@@ -2,9 +2,11 @@
 MSG91 Client for Python
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from msg91.http_client import HTTPClient
+from msg91.resources.async_otp import AsyncOTPResource
+from msg91.resources.async_sms import AsyncSMSResource
 from msg91.resources.otp import OTPResource
 from msg91.resources.sms import SMSResource
 from msg91.resources.template import TemplateResource
@@ -18,7 +20,27 @@ class Client:
         auth_key: Your MSG91 authentication key
         base_url: Custom API base URL (optional)
         timeout: Request timeout in seconds (default: 30)
-        **httpx_kwargs: Additional keyword arguments for httpx.Client
+        concurrent_requests: Maximum in-flight async requests (default: 50)
+        rate_limit: Optional (requests, seconds) quota, e.g. (100, 1.0) for 100/s
+        max_retries: Retries for 429/502/503/504 responses (default: 0, disabled). Note that
+            retrying a send after a gateway error may deliver the message twice.
+        backoff_factor: Base delay for exponential backoff between retries (default: 0.5s),
+            unless the response has a Retry-After header
+        max_backoff: Upper bound in seconds for any single retry delay, including one
+            requested by Retry-After (default: 30)
+        cache_ttl: Seconds to cache identical SMS log/analytics queries (disabled by default)
+        async_httpx_kwargs: Keyword arguments for httpx.AsyncClient only, e.g. an
+            ``httpx.AsyncHTTPTransport`` as ``transport``
+        **httpx_kwargs: Additional keyword arguments for httpx.Client, e.g. ``http2=True``
+            (requires the ``http2`` extra). They are shared with httpx.AsyncClient, except
+            for sync-only ``transport``, ``mounts`` and ``event_hooks``.
+
+    The client keeps a pool of open connections that is reused across calls.
+    Call ``close()`` when done, or use the client as a context manager.
+
+    ``async_sms`` and ``async_otp`` expose awaitable variants of the SMS and OTP
+    resources for use with asyncio. Once they have been used, release the client with
+    ``aclose()`` (or ``async with``): ``close()`` cannot close the async pool.
     """
 
     def __init__(
@@ -26,16 +48,51 @@ class Client:
         auth_key: str,
         base_url: Optional[str] = None,
         timeout: int = 30,
+        concurrent_requests: int = 50,
+        rate_limit: Optional[Tuple[int, float]] = None,
+        max_retries: int = 0,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        cache_ttl: Optional[float] = None,
+        async_httpx_kwargs: Optional[Dict[str, Any]] = None,
         **httpx_kwargs: Any,
     ):
         self.http_client = HTTPClient(
             auth_key=auth_key,
             base_url=base_url,
             timeout=timeout,
+            concurrent_requests=concurrent_requests,
+            rate_limit=rate_limit,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            max_backoff=max_backoff,
+            async_httpx_kwargs=async_httpx_kwargs,
             **httpx_kwargs,
         )
 
         # Initialize resources
-        self.sms = SMSResource(self.http_client)
+        self.sms = SMSResource(self.http_client, cache_ttl=cache_ttl)
         self.template = TemplateResource(self.http_client)
         self.otp = OTPResource(self.http_client)
+        self.async_sms = AsyncSMSResource(self.http_client)
+        self.async_otp = AsyncOTPResource(self.http_client)
+
+    def close(self) -> None:
+        """Close the sync HTTP connections; use ``aclose()`` after async calls"""
+        self.http_client.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close both the sync and async HTTP connections"""
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -2,12 +2,62 @@
 HTTP Client for MSG91 API
 """
 
-from typing import Any, Dict, Optional, cast
-from urllib.parse import urljoin
+import asyncio
+import inspect
+import json
+import time
+from typing import Any, Dict, NoReturn, Optional, Tuple, cast
 
 import httpx
 
 from msg91.exceptions import APIError, AuthenticationError, MSG91Exception, ValidationError
+from msg91.rate_limit import RateLimiter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+if HAS_ORJSON:
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode a JSON request body with orjson"""
+        return orjson.dumps(obj)
+
+    def _json_loads(content: bytes) -> Any:
+        """Decode a JSON response body with orjson"""
+        return orjson.loads(content)
+
+else:  # pragma: no cover - exercised only without the fast extra
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode a JSON request body compactly with the standard library"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _json_loads(content: bytes) -> Any:
+        """Decode a JSON response body with the standard library"""
+        return json.loads(content)
+
+
+def _async_httpx_kwargs(httpx_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop sync-only transports and event hooks that httpx.AsyncClient cannot use"""
+    kwargs = dict(httpx_kwargs)
+    transport = kwargs.get("transport")
+    if transport is not None and not isinstance(transport, httpx.AsyncBaseTransport):
+        del kwargs["transport"]
+    mounts = kwargs.get("mounts")
+    if mounts and not all(
+        mount is None or isinstance(mount, httpx.AsyncBaseTransport) for mount in mounts.values()
+    ):
+        del kwargs["mounts"]
+    event_hooks = kwargs.get("event_hooks")
+    if event_hooks and not all(
+        inspect.iscoroutinefunction(hook) for hooks in event_hooks.values() for hook in hooks
+    ):
+        del kwargs["event_hooks"]
+    return kwargs
 
 
 class HTTPClient:
@@ -18,21 +68,128 @@ class HTTPClient:
     """
 
     V5_BASE_URL = "https://control.msg91.com/api/v5"
-    V2_BASE_URL = "http://api.msg91.com/api"
+    V2_BASE_URL = "https://api.msg91.com/api"
+
+    # Rate limiting and temporary server errors that are safe to retry after a pause
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+    # Methods whose responses can be revalidated; on other methods a matching
+    # If-None-Match means 412 Precondition Failed, not 304 (RFC 9110)
+    CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
 
     def __init__(
         self,
         auth_key: str,
         base_url: Optional[str] = None,
         timeout: int = 30,
+        concurrent_requests: int = 50,
+        rate_limit: Optional[Tuple[int, float]] = None,
+        max_retries: int = 0,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        async_httpx_kwargs: Optional[Dict[str, Any]] = None,
         **httpx_kwargs: Any,
     ):
         self.auth_key = auth_key
+        # Shared, never mutated: per-request headers are merged into a new dict
+        self._auth_headers = {"authkey": auth_key}
+        self._json_headers = {"authkey": auth_key, "Content-Type": "application/json"}
         self.v5_base_url = base_url or self.V5_BASE_URL
         self.v2_base_url = self.V2_BASE_URL
+        # One keep-alive pool shared by every resource; pass ``limits`` to resize it
         self.httpx_kwargs = httpx_kwargs
+        # Sync-only transports and hooks are not inherited; async ones can be given separately
+        self.async_httpx_kwargs = {
+            **_async_httpx_kwargs(self.httpx_kwargs),
+            **(async_httpx_kwargs or {}),
+        }
         self.timeout = timeout
         self.client = httpx.Client(timeout=self.timeout, **self.httpx_kwargs)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._urls: Dict[Tuple[str, str], httpx.URL] = {}
+        self.concurrent_requests = concurrent_requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.rate_limiter = RateLimiter(*rate_limit) if rate_limit else None
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared httpx.AsyncClient, created on first use"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout, **self.async_httpx_kwargs)
+        return self._async_client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Caps in-flight async requests, created on first use inside the event loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrent_requests)
+        return self._semaphore
+
+    def close(self) -> None:
+        """
+        Close the sync connection pool
+
+        An async pool, once created, can only be closed from a coroutine; use ``aclose()``.
+        """
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the sync and async connection pools"""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._semaphore = None
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _build_url(self, path: str, api_version: str) -> httpx.URL:
+        """Resolve an API path against its base URL, parsing each endpoint only once"""
+        key = (api_version, path)
+        url = self._urls.get(key)
+        if url is not None:
+            return url
+
+        # Determine base URL based on API version
+        if api_version == "v5":
+            base_url = self.v5_base_url
+        elif api_version == "v2":
+            base_url = self.v2_base_url
+        else:
+            raise ValueError(f"Unsupported API version: {api_version}")
+
+        # Append the path to the base URL (urljoin would drop its last segment)
+        url = httpx.URL(f"{base_url.rstrip('/')}/{path.lstrip('/')}")
+        self._urls[key] = url
+        return url
+
+    def _prepare_request(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        api_version: str,
+    ) -> Tuple[httpx.URL, Dict[str, str]]:
+        """Build the final URL and request headers"""
+        url = self._build_url(path, api_version)
+
+        # JSON requests and all v5 APIs send a JSON content type
+        if json_data is not None or api_version == "v5":
+            request_headers = self._json_headers
+        else:
+            request_headers = self._auth_headers
+
+        if headers:
+            request_headers = {**request_headers, **headers}
+
+        return url, request_headers
 
     def request(
         self,
@@ -56,82 +213,180 @@ class HTTPClient:
             headers: Additional headers
             api_version: API version to use ("v5" or "v2")
         """
-        # Determine base URL based on API version
-        if api_version == "v5":
-            base_url = self.v5_base_url
-        elif api_version == "v2":
-            base_url = self.v2_base_url
-        else:
-            raise ValueError(f"Unsupported API version: {api_version}")
+        response = self._send(method, path, params, data, json_data, headers, api_version)
+        return self._parse_response(response)
 
-        # Build final URL
-        url = urljoin(base_url, path)
+    def conditional_request(
+        self,
+        method: str,
+        path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        api_version: str = "v5",
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        Make a request that revalidates a previously cached response
 
-        # Prepare headers with authentication
-        request_headers = {
-            "authkey": self.auth_key,
-        }
+        Sends If-None-Match / If-Modified-Since when validators are given and
+        ``method`` is GET or HEAD; other methods are sent unconditionally.
 
-        # Set content type for JSON requests
-        if json_data:
-            request_headers["Content-Type"] = "application/json"
-        elif api_version == "v5":
-            # For v5 APIs, always set JSON content type
-            request_headers["Content-Type"] = "application/json"
+        Returns:
+            Tuple of (data, etag, last_modified) from the response. ``data`` is
+            None when the server answers 304 Not Modified.
+        """
+        headers = {}
+        if method.upper() in self.CONDITIONAL_METHODS:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
-        if headers:
-            request_headers.update(headers)
+        response = self._send(method, path, params, None, json_data, headers, api_version)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
 
-        try:
-            response = self.client.request(
-                method,
-                url,
-                params=params,
-                data=data,
-                json=json_data,
-                headers=request_headers,
-            )
+        if response.status_code == 304:
+            return None, etag, last_modified
+        return self._parse_response(response), etag, last_modified
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        api_version: str,
+    ) -> httpx.Response:
+        """Send a request and return the raw response, retrying transient failures"""
+        url, request_headers = self._prepare_request(path, json_data, headers, api_version)
+        content = None if json_data is None else _json_dumps(json_data)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
 
-            response_data = self._parse_response(response)
-            return response_data
+            try:
+                response = self.client.request(
+                    method,
+                    url,
+                    params=params,
+                    data=data,
+                    content=content,
+                    headers=request_headers,
+                )
+            except httpx.RequestError as e:
+                raise MSG91Exception(f"Network error: {str(e)}") from e
+
+            if not self._should_retry(response, attempt):
+                return response
 
-        except httpx.RequestError as e:
-            raise MSG91Exception(f"Network error: {str(e)}") from e
+            time.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+
+    async def async_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        api_version: str = "v5",
+    ) -> Dict[str, Any]:
+        """Make a request to the MSG91 API without blocking the event loop"""
+        url, request_headers = self._prepare_request(path, json_data, headers, api_version)
+        content = None if json_data is None else _json_dumps(json_data)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+
+            try:
+                async with self.semaphore:
+                    response = await self.async_client.request(
+                        method,
+                        url,
+                        params=params,
+                        data=data,
+                        content=content,
+                        headers=request_headers,
+                    )
+            except httpx.RequestError as e:
+                raise MSG91Exception(f"Network error: {str(e)}") from e
+
+            if not self._should_retry(response, attempt):
+                return self._parse_response(response)
+
+            # Wait outside the semaphore so other requests can use the slot
+            await asyncio.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+
+    def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        """Whether a response is a transient failure worth retrying"""
+        return attempt < self.max_retries and response.status_code in self.RETRY_STATUSES
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying, honouring Retry-After when given in seconds
+
+        The delay never exceeds ``max_backoff``, so a server asking for a long pause
+        cannot stall the caller for that long.
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = self.backoff_factor * (2**attempt)
+        return float(min(delay, self.max_backoff))
 
     def _parse_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Parse the API response and handle errors"""
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except ValueError:
             data = {"raw_content": response.text}
 
-        if not response.is_success:
-            # Handle error responses
-            error_type = data.get("type", "").lower() if isinstance(data, dict) else ""
-            message = (
-                data.get("message", "Unknown error") if isinstance(data, dict) else "Unknown error"
-            )
+        if response.is_success:
+            return cast(Dict[str, Any], data)
 
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    message=message,
-                    status=response.status_code,
-                    details=data,
-                )
-            elif response.status_code == 400 or error_type == "validation":
-                raise ValidationError(
-                    message=message,
-                    status=response.status_code,
-                    details=data,
-                )
-            else:
-                raise APIError(
-                    message=message,
-                    status=response.status_code,
-                    details=data,
-                )
+        self._raise_for_response(response, data)
 
-        return cast(Dict[str, Any], data)
+    @staticmethod
+    def _raise_for_response(
+        response: httpx.Response, data: Any, default_message: str = "Unknown error"
+    ) -> NoReturn:
+        """Raise the exception matching an error response"""
+        if isinstance(data, dict):
+            error_type = str(data.get("type", "")).lower()
+            message = data.get("message", default_message)
+        else:
+            error_type = ""
+            message = default_message
+
+        if response.status_code == 401:
+            raise AuthenticationError(
+                message=message,
+                status=response.status_code,
+                details=data,
+            )
+        elif response.status_code == 400 or error_type == "validation":
+            raise ValidationError(
+                message=message,
+                status=response.status_code,
+                details=data,
+            )
+        else:
+            raise APIError(
+                message=message,
+                status=response.status_code,
+                details=data,
+            )
 
     def get(
         self,
@@ -192,3 +447,35 @@ class HTTPClient:
     ) -> Dict[str, Any]:
         """Make a DELETE request"""
         return self.request("DELETE", path, params=params, headers=headers, api_version=api_version)
+
+    async def async_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        api_version: str = "v5",
+    ) -> Dict[str, Any]:
+        """Make an async GET request"""
+        return await self.async_request(
+            "GET", path, params=params, headers=headers, api_version=api_version
+        )
+
+    async def async_post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        api_version: str = "v5",
+    ) -> Dict[str, Any]:
+        """Make an async POST request"""
+        return await self.async_request(
+            "POST",
+            path,
+            params=params,
+            data=data,
+            json_data=json_data,
+            headers=headers,
+            api_version=api_version,
+        )
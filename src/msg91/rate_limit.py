@@ -0,0 +1,56 @@
+"""
+Token bucket rate limiter for MSG91 API requests
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket allowing ``rate`` requests every ``per`` seconds
+
+    Bursts up to ``rate`` requests go out immediately; after that requests are
+    paced as tokens refill. The async variant waits with ``asyncio.sleep`` so
+    the event loop is never blocked.
+
+    Args:
+        rate: Number of requests allowed per period
+        per: Length of the period in seconds (default: 1)
+    """
+
+    def __init__(self, rate: int, per: float = 1.0):
+        if rate <= 0 or per <= 0:
+            raise ValueError("Rate limit must be positive")
+
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before it may be used"""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.per
+            self._tokens = min(float(self.rate), self._tokens + refill)
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.per / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait until a request may be sent without blocking the event loop"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
@@ -2,8 +2,16 @@
 MSG91 API Resources
 """
 
+from msg91.resources.async_otp import AsyncOTPResource
+from msg91.resources.async_sms import AsyncSMSResource
 from msg91.resources.otp import OTPResource
 from msg91.resources.sms import SMSResource
 from msg91.resources.template import TemplateResource
 
-__all__ = ["SMSResource", "TemplateResource", "OTPResource"]
+__all__ = [
+    "SMSResource",
+    "TemplateResource",
+    "OTPResource",
+    "AsyncSMSResource",
+    "AsyncOTPResource",
+]
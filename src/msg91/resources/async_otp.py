@@ -0,0 +1,81 @@
+"""
+Async OTP Resource for MSG91 API
+"""
+
+from typing import Any, Dict, Optional
+
+from msg91.resources.base import BaseResource
+from msg91.resources.otp import OTPResource, _resend_params, _send_params, _verify_params
+
+
+class AsyncOTPResource(BaseResource):
+    """Async variant of OTPResource for sending many OTPs concurrently"""
+
+    SEND_PATH = OTPResource.SEND_PATH
+    VERIFY_PATH = OTPResource.VERIFY_PATH
+    RESEND_PATH = OTPResource.RESEND_PATH
+
+    async def send(
+        self,
+        mobile: str,
+        message: Optional[str] = None,
+        sender: Optional[str] = None,
+        otp: Optional[str] = None,
+        otp_expiry: Optional[int] = None,
+        otp_length: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Send OTP to a mobile number
+
+        Args:
+            mobile: The mobile number to send OTP to (with country code)
+            message: Custom OTP message (default: "Your verification code is ##OTP##")
+            sender: Sender ID (default: SMSIND)
+            otp: Specific OTP to send (auto-generated if not provided)
+            otp_expiry: OTP expiry time in minutes (default: 1 day)
+            otp_length: OTP digit count (4-9, default: 4)
+
+        Returns:
+            Response from the API containing session ID
+        """
+        params = _send_params(mobile, message, sender, otp, otp_expiry, otp_length, kwargs)
+        return await self.http_client.async_get(self.SEND_PATH, params=params, api_version="v2")
+
+    async def verify(
+        self,
+        mobile: str,
+        otp: str,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Verify OTP for a mobile number
+
+        Args:
+            mobile: The mobile number to verify OTP for
+            otp: The OTP to verify
+
+        Returns:
+            Response from the API indicating verification status
+        """
+        params = _verify_params(mobile, otp, kwargs)
+        return await self.http_client.async_get(self.VERIFY_PATH, params=params, api_version="v2")
+
+    async def resend(
+        self,
+        mobile: str,
+        retrytype: str = "text",
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Resend OTP to a mobile number
+
+        Args:
+            mobile: The mobile number to resend OTP to
+            retrytype: Type of retry - "text", "voice" (default: "text")
+
+        Returns:
+            Response from the API
+        """
+        params = _resend_params(mobile, retrytype, kwargs)
+        return await self.http_client.async_get(self.RESEND_PATH, params=params, api_version="v2")
@@ -0,0 +1,140 @@
+"""
+Async SMS Resource for MSG91 API
+"""
+
+import asyncio
+from itertools import islice
+from typing import Any, Dict, List, Optional, Union, cast
+
+from msg91.exceptions import MSG91Exception
+from msg91.resources.base import BaseResource, _validate_mobile
+from msg91.resources.sms import SMSResource, _send_payload, _template_payload
+
+
+class AsyncSMSResource(BaseResource):
+    """Async variant of SMSResource for sending many SMS concurrently"""
+
+    SEND_PATH = SMSResource.SEND_PATH
+    FLOW_PATH = SMSResource.FLOW_PATH
+
+    async def send(
+        self,
+        mobile: Union[str, List[str]],
+        message: str,
+        sender: str,
+        route: str = "4",
+        country: Optional[str] = None,
+        flash: Optional[bool] = None,
+        unicode: Optional[bool] = None,
+        scheduled_datetime: Optional[str] = None,
+        campaign: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Send SMS using MSG91 API
+
+        Args:
+            mobile: The mobile number(s) to send SMS to (with country code)
+            message: The SMS message content
+            sender: The sender ID to use for sending SMS
+            route: SMS route (1 for promotional, 4 for transactional)
+            country: Country code (0 for international, 91 for India)
+            flash: Whether to send as flash SMS
+            unicode: Whether to send as unicode SMS
+            scheduled_datetime: Schedule SMS for specific time
+            campaign: Campaign name for tracking
+
+        Returns:
+            Response from the API
+        """
+        payload = _send_payload(
+            mobile,
+            message,
+            sender,
+            route,
+            country,
+            flash,
+            unicode,
+            scheduled_datetime,
+            campaign,
+            kwargs,
+        )
+        return await self.http_client.async_post(
+            self.SEND_PATH, json_data=payload, api_version="v2"
+        )
+
+    async def send_many(
+        self,
+        mobiles: List[str],
+        message: str,
+        sender: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> List[Union[Dict[str, Any], MSG91Exception]]:
+        """
+        Send the same SMS to many mobile numbers in concurrent batches
+
+        Mobile numbers are split into batches of ``batch_size``; each batch is sent
+        as a single bulk request and all batches are dispatched concurrently,
+        subject to the client's ``concurrent_requests`` limit.
+
+        Every number is validated before any batch is sent, so a malformed number
+        raises ValueError without sending anything. A batch that fails with
+        an API or network error does not cancel the others: its exception is returned
+        in place of its response, so callers can retry only the failed batches
+        without re-sending the ones that were delivered.
+
+        Args:
+            mobiles: The mobile numbers to send SMS to (with country code)
+            message: The SMS message content
+            sender: The sender ID to use for sending SMS
+            batch_size: Maximum mobile numbers per request (default: 100)
+            **kwargs: Additional options accepted by ``send``
+
+        Returns:
+            One response or MSG91Exception per batch, in the same order as the input numbers
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        _validate_mobile(mobiles)
+
+        numbers = iter(mobiles)
+        batches = []
+        while batch := list(islice(numbers, batch_size)):
+            batches.append(batch)
+
+        results = await asyncio.gather(
+            *(self.send(batch, message, sender, **kwargs) for batch in batches),
+            return_exceptions=True,
+        )
+
+        # Only delivery failures are reported per batch; anything else is a bug to surface
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, MSG91Exception):
+                raise result
+        return cast(List[Union[Dict[str, Any], MSG91Exception]], results)
+
+    async def send_template(
+        self,
+        template_id: str,
+        mobile: Union[str, List[str]],
+        variables: Optional[Dict[str, Any]] = None,
+        sender_id: Optional[str] = None,
+        short_url: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Send an SMS using a template (Flow API)
+
+        Args:
+            template_id: The template ID to use for sending SMS
+            mobile: The mobile number(s) to send SMS to
+            variables: Template variables for substitution
+            sender_id: The sender ID to use for sending SMS
+            short_url: Whether to use short URLs in the SMS
+
+        Returns:
+            Response from the API
+        """
+        payload = _template_payload(template_id, mobile, variables, sender_id, short_url, kwargs)
+        return await self.http_client.async_post(self.FLOW_PATH, json_data=payload)
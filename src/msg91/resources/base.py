@@ -2,11 +2,25 @@
 Base resource class for MSG91 API resources
 """
 
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, List, Union
 
 if TYPE_CHECKING:
     from msg91.http_client import HTTPClient
 
+# Mobile numbers with country code, ASCII digits only (e.g. 919999999999)
+_MOBILE_RE = re.compile(r"[0-9]{10,15}")
+
+
+def _validate_mobile(mobile: Union[str, List[str]]) -> None:
+    """Reject malformed mobile numbers before making a request"""
+    numbers = [mobile] if isinstance(mobile, str) else mobile
+    if not isinstance(numbers, (list, tuple)) or not numbers:
+        raise ValueError(f"Invalid mobile number: {mobile!r}")
+    for number in numbers:
+        if not isinstance(number, str) or not _MOBILE_RE.fullmatch(number):
+            raise ValueError(f"Invalid mobile number: {number!r}")
+
 
 class BaseResource:
     """Base class for all API resources"""
@@ -4,12 +4,58 @@ OTP Resource for MSG91 API
 
 from typing import Any, Dict, Optional
 
-from msg91.resources.base import BaseResource
+from msg91.resources.base import BaseResource, _validate_mobile
+
+_VALID_OTP_LENGTHS = frozenset(range(4, 10))
+
+
+def _send_params(
+    mobile: str,
+    message: Optional[str],
+    sender: Optional[str],
+    otp: Optional[str],
+    otp_expiry: Optional[int],
+    otp_length: Optional[int],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build query parameters for the SendOTP API"""
+    # Checked first so a bad length short-circuits before any other validation or building
+    if otp_length is not None and otp_length not in _VALID_OTP_LENGTHS:
+        raise ValueError("OTP length must be between 4 and 9")
+    _validate_mobile(mobile)
+
+    optional = (
+        ("message", message),
+        ("sender", sender),
+        ("otp", otp),
+        ("otp_expiry", otp_expiry),
+        ("otp_length", otp_length),
+    )
+
+    # Unset options are omitted; additional parameters are passed through as-is
+    return {"mobile": mobile, **{key: value for key, value in optional if value}, **extra}
+
+
+def _verify_params(mobile: str, otp: str, extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Build query parameters for the Verify OTP API"""
+    _validate_mobile(mobile)
+    return {"mobile": mobile, "otp": otp, **extra}
+
+
+def _resend_params(mobile: str, retrytype: str, extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Build query parameters for the Retry OTP API"""
+    _validate_mobile(mobile)
+    return {"mobile": mobile, "retrytype": retrytype, **extra}
 
 
 class OTPResource(BaseResource):
     """Resource for OTP operations including send, verify, and resend"""
 
+    # SendOTP API endpoints, relative to the v2 base URL
+    SEND_PATH = "sendotp.php"
+    VERIFY_PATH = "verifyRequestOTP.php"
+    RESEND_PATH = "retryotp.php"
+
     def send(
         self,
         mobile: str,
@@ -34,34 +80,10 @@ class OTPResource(BaseResource):
         Returns:
             Response from the API containing session ID
         """
-        # Prepare parameters
-        params: Dict[str, Any] = {
-            "mobile": mobile,
-        }
-
-        if message:
-            params["message"] = message
-
-        if sender:
-            params["sender"] = sender
-
-        if otp:
-            params["otp"] = otp
-
-        if otp_expiry:
-            params["otp_expiry"] = otp_expiry
-
-        if otp_length:
-            if not (4 <= otp_length <= 9):
-                raise ValueError("OTP length must be between 4 and 9")
-            params["otp_length"] = otp_length
-
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            params[key] = value
+        params = _send_params(mobile, message, sender, otp, otp_expiry, otp_length, kwargs)
 
         # Use MSG91's SendOTP API endpoint
-        return self.http_client.get("sendotp.php", params=params, api_version="v2")
+        return self.http_client.get(self.SEND_PATH, params=params, api_version="v2")
 
     def verify(
         self,
@@ -79,18 +101,10 @@ class OTPResource(BaseResource):
         Returns:
             Response from the API indicating verification status
         """
-        # Prepare parameters
-        params: Dict[str, Any] = {
-            "mobile": mobile,
-            "otp": otp,
-        }
-
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            params[key] = value
+        params = _verify_params(mobile, otp, kwargs)
 
         # Use MSG91's Verify OTP API endpoint
-        return self.http_client.get("verifyRequestOTP.php", params=params, api_version="v2")
+        return self.http_client.get(self.VERIFY_PATH, params=params, api_version="v2")
 
     def resend(
         self,
@@ -108,15 +122,7 @@ class OTPResource(BaseResource):
         Returns:
             Response from the API
         """
-        # Prepare parameters
-        params: Dict[str, Any] = {
-            "mobile": mobile,
-            "retrytype": retrytype,
-        }
-
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            params[key] = value
+        params = _resend_params(mobile, retrytype, kwargs)
 
         # Use MSG91's Retry OTP API endpoint
-        return self.http_client.get("retryotp.php", params=params, api_version="v2")
+        return self.http_client.get(self.RESEND_PATH, params=params, api_version="v2")
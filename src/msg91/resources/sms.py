@@ -2,13 +2,175 @@
 SMS Resource for MSG91 API
 """
 
-from typing import Any, Dict, List, Optional, Union
-
-from msg91.resources.base import BaseResource
+import copy
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+
+from msg91.cache import TTLCache
+from msg91.resources.base import BaseResource, _validate_mobile
+
+if TYPE_CHECKING:
+    from msg91.http_client import HTTPClient
+
+
+def _format_recipients(
+    mobile: Union[str, List[str]], variables: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Format recipients for the API payload"""
+    if isinstance(mobile, str):
+        mobile = [mobile]
+
+    # Every recipient shares the same variables dict; the payload is serialised once
+    if variables:
+        return [{"mobile": number, "variables": variables} for number in mobile]
+    return [{"mobile": number} for number in mobile]
+
+
+def _send_payload(
+    mobile: Union[str, List[str]],
+    message: str,
+    sender: str,
+    route: str,
+    country: Optional[str],
+    flash: Optional[bool],
+    unicode: Optional[bool],
+    scheduled_datetime: Optional[str],
+    campaign: Optional[str],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build the JSON payload for the v2 send SMS API"""
+    # The v2 API takes a comma-separated list, so a string may already hold several numbers
+    numbers = mobile.split(",") if isinstance(mobile, str) else mobile
+    _validate_mobile(numbers)
+
+    optional = (
+        ("country", country),
+        ("flash", _flag(flash)),
+        ("unicode", _flag(unicode)),
+        ("scheduledatetime", scheduled_datetime or None),
+        ("campaign", campaign or None),
+    )
+
+    return {
+        "mobiles": ",".join(numbers),
+        "message": message,
+        "sender": sender,
+        "route": route,
+        "response": "json",
+        **{key: value for key, value in optional if value is not None},
+        **extra,
+    }
+
+
+def _template_payload(
+    template_id: str,
+    mobile: Union[str, List[str]],
+    variables: Optional[Dict[str, Any]],
+    sender_id: Optional[str],
+    short_url: Optional[bool],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build the JSON payload for the Flow API"""
+    _validate_mobile(mobile)
+
+    optional = (
+        ("sender", sender_id or None),
+        ("short_url", _flag(short_url)),
+    )
+
+    return {
+        "template_id": template_id,
+        "recipients": _format_recipients(mobile, variables),
+        **{key: value for key, value in optional if value is not None},
+        **extra,
+    }
+
+
+def _report_filters(
+    start_date: Optional[str], end_date: Optional[str], extra: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the date range filters shared by the log and analytics reports"""
+    dates = (("start_date", start_date), ("end_date", end_date))
+    return {**{key: value for key, value in dates if value}, **extra}
+
+
+def _flag(value: Optional[bool]) -> Optional[str]:
+    """Encode an optional boolean as the "1"/"0" strings the API expects"""
+    if value is None:
+        return None
+    return "1" if value else "0"
 
 
 class SMSResource(BaseResource):
-    """Resource for sending SMS and managing SMS-related operations"""
+    """
+    Resource for sending SMS and managing SMS-related operations
+
+    Args:
+        http_client: HTTP client used for API requests
+        cache_ttl: Seconds to cache identical log and analytics queries (disabled by default)
+    """
+
+    SEND_PATH = "v2/sendsms"
+    FLOW_PATH = "flow"
+    LOGS_PATH = "report/logs/p/sms"
+    ANALYTICS_PATH = "report/analytics/p/sms"
+
+    def __init__(self, http_client: "HTTPClient", cache_ttl: Optional[float] = None):
+        super().__init__(http_client)
+        self._cache = TTLCache(ttl=cache_ttl) if cache_ttl else None
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached log and analytics responses"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cached(
+        self,
+        key: Tuple[Any, ...],
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Serve a report query from the cache
+
+        Fresh entries are returned without a request. Expired GET entries are
+        revalidated with their ETag/Last-Modified, reusing the cached data on
+        304 Not Modified; expired entries for other methods are re-fetched.
+        Callers always get their own copy, so mutating a result cannot alter the cache.
+        """
+        cache = cast(TTLCache, self._cache)
+        try:
+            entry = cache.get(key, stale=True)
+        except TypeError:
+            # Unhashable filter values (lists, dicts) always go to the API
+            return self.http_client.request(method, path, params=params, json_data=json_data)
+
+        if entry is not None and cache.get(key) is not None:
+            return cast(Dict[str, Any], copy.deepcopy(entry["data"]))
+
+        if method.upper() not in self.http_client.CONDITIONAL_METHODS:
+            response = self.http_client.request(method, path, params=params, json_data=json_data)
+            cache.set(key, {"etag": None, "last_modified": None, "data": response})
+            return copy.deepcopy(response)
+
+        data, etag, last_modified = self.http_client.conditional_request(
+            method,
+            path,
+            etag=entry["etag"] if entry else None,
+            last_modified=entry["last_modified"] if entry else None,
+            params=params,
+            json_data=json_data,
+        )
+        if data is None:
+            # 304 Not Modified: the cached copy is still current
+            entry = cast(Dict[str, Any], entry)
+            data = entry["data"]
+            etag = etag or entry["etag"]
+            last_modified = last_modified or entry["last_modified"]
+
+        cache.set(key, {"etag": etag, "last_modified": last_modified, "data": data})
+        return copy.deepcopy(data)
 
     def send(
         self,
@@ -40,42 +202,21 @@ class SMSResource(BaseResource):
         Returns:
             Response from the API
         """
-        # Format mobile numbers
-        if isinstance(mobile, list):
-            mobile_str = ",".join(mobile)
-        else:
-            mobile_str = mobile
-
-        # Prepare payload
-        payload: Dict[str, Any] = {
-            "mobiles": mobile_str,
-            "message": message,
-            "sender": sender,
-            "route": route,
-            "response": "json",
-        }
-
-        if country is not None:
-            payload["country"] = country
-
-        if flash is not None:
-            payload["flash"] = "1" if flash else "0"
-
-        if unicode is not None:
-            payload["unicode"] = "1" if unicode else "0"
-
-        if scheduled_datetime:
-            payload["scheduledatetime"] = scheduled_datetime
-
-        if campaign:
-            payload["campaign"] = campaign
-
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            payload[key] = value
+        payload = _send_payload(
+            mobile,
+            message,
+            sender,
+            route,
+            country,
+            flash,
+            unicode,
+            scheduled_datetime,
+            campaign,
+            kwargs,
+        )
 
         # Use MSG91's v2 SMS API endpoint
-        return self.http_client.post("v2/sendsms", json_data=payload, api_version="v2")
+        return self.http_client.post(self.SEND_PATH, json_data=payload, api_version="v2")
 
     def send_template(
         self,
@@ -99,38 +240,8 @@ class SMSResource(BaseResource):
         Returns:
             Response from the API
         """
-        payload: Dict[str, Any] = {
-            "template_id": template_id,
-            "recipients": self._format_recipients(mobile, variables),
-        }
-
-        if sender_id:
-            payload["sender"] = sender_id
-
-        if short_url is not None:
-            payload["short_url"] = "1" if short_url else "0"
-
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            payload[key] = value
-
-        return self.http_client.post("flow", json_data=payload)
-
-    def _format_recipients(
-        self, mobile: Union[str, List[str]], variables: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
-        """Format recipients for the API payload"""
-        if isinstance(mobile, str):
-            mobile = [mobile]
-
-        recipients = []
-        for number in mobile:
-            recipient: Dict[str, Any] = {"mobile": number}
-            if variables:
-                recipient["variables"] = variables
-            recipients.append(recipient)
-
-        return recipients
+        payload = _template_payload(template_id, mobile, variables, sender_id, short_url, kwargs)
+        return self.http_client.post(self.FLOW_PATH, json_data=payload)
 
     def get_logs(
         self,
@@ -148,19 +259,13 @@ class SMSResource(BaseResource):
         Returns:
             SMS logs response
         """
-        payload: Dict[str, Any] = {}
-
-        if start_date:
-            payload["start_date"] = start_date
+        payload = _report_filters(start_date, end_date, kwargs)
 
-        if end_date:
-            payload["end_date"] = end_date
+        if self._cache is not None:
+            cache_key = ("logs", start_date, end_date, tuple(sorted(kwargs.items())))
+            return self._cached(cache_key, "POST", self.LOGS_PATH, json_data=payload)
 
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            payload[key] = value
-
-        return self.http_client.post("report/logs/p/sms", json_data=payload)
+        return self.http_client.post(self.LOGS_PATH, json_data=payload)
 
     def get_analytics(
         self,
@@ -178,16 +283,10 @@ class SMSResource(BaseResource):
         Returns:
             SMS analytics response
         """
-        params: Dict[str, Any] = {}
-
-        if start_date:
-            params["start_date"] = start_date
-
-        if end_date:
-            params["end_date"] = end_date
+        params = _report_filters(start_date, end_date, kwargs)
 
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            params[key] = value
+        if self._cache is not None:
+            cache_key = ("analytics", start_date, end_date, tuple(sorted(kwargs.items())))
+            return self._cached(cache_key, "GET", self.ANALYTICS_PATH, params=params)
 
-        return self.http_client.get("report/analytics/p/sms", params=params)
+        return self.http_client.get(self.ANALYTICS_PATH, params=params)
@@ -0,0 +1,82 @@
+"""
+Tests for the async OTP Resource
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from msg91 import Client
+from msg91.exceptions import AuthenticationError
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client():
+    """Create a test client"""
+    return Client("test_auth_key")
+
+
+def test_async_send_otp(client):
+    """Test async OTP sending"""
+    with patch.object(client.http_client, "async_get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = {"type": "success", "message": "session_id"}
+
+        response = asyncio.run(client.async_otp.send(mobile="919999999999", otp_length=6))
+
+        mock_get.assert_awaited_once()
+        args, kwargs = mock_get.call_args
+        assert args[0] == "sendotp.php"
+        assert kwargs["api_version"] == "v2"
+        assert kwargs["params"] == {"mobile": "919999999999", "otp_length": 6}
+        assert response["type"] == "success"
+
+
+def test_async_send_otp_invalid_length(client):
+    """Test async OTP sending validates length before any request"""
+    with pytest.raises(ValueError, match="OTP length must be between 4 and 9"):
+        asyncio.run(client.async_otp.send(mobile="919999999999", otp_length=3))
+
+
+def test_async_verify_and_resend_otp(client):
+    """Test async OTP verification and resending"""
+    with patch.object(client.http_client, "async_get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = {"type": "success"}
+
+        asyncio.run(client.async_otp.verify(mobile="919999999999", otp="1234"))
+        args, kwargs = mock_get.call_args
+        assert args[0] == "verifyRequestOTP.php"
+        assert kwargs["params"] == {"mobile": "919999999999", "otp": "1234"}
+
+        asyncio.run(client.async_otp.resend(mobile="919999999999", retrytype="voice"))
+        args, kwargs = mock_get.call_args
+        assert args[0] == "retryotp.php"
+        assert kwargs["params"] == {"mobile": "919999999999", "retrytype": "voice"}
+
+
+def test_async_send_otp_concurrently(client):
+    """Test many OTPs can be sent concurrently with asyncio.gather"""
+    with patch.object(client.http_client, "async_get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = {"type": "success"}
+
+        async def send_all():
+            mobiles = [f"9199999999{i:02d}" for i in range(10)]
+            return await asyncio.gather(*(client.async_otp.send(mobile=m) for m in mobiles))
+
+        responses = asyncio.run(send_all())
+
+        assert len(responses) == 10
+        assert mock_get.await_count == 10
+
+
+def test_async_send_otp_authentication_error(client):
+    """Test async OTP send surfaces API errors"""
+    with patch.object(client.http_client, "async_get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = AuthenticationError(message="Invalid authentication key", status=401)
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            asyncio.run(client.async_otp.send(mobile="919999999999"))
+
+        assert exc_info.value.status == 401
@@ -0,0 +1,123 @@
+"""
+Tests for the async SMS resource
+"""
+
+import asyncio
+from unittest.mock import create_autospec
+
+import pytest
+
+from msg91.exceptions import APIError
+from msg91.http_client import HTTPClient
+from msg91.resources.async_sms import AsyncSMSResource
+
+pytestmark = pytest.mark.unit
+
+
+def test_async_send_sms():
+    """Test sending SMS asynchronously"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.async_post.return_value = {"type": "success"}
+
+    sms = AsyncSMSResource(http_client)
+    response = asyncio.run(
+        sms.send(mobile=["919999999999", "918888888888"], message="Test", sender="SENDER")
+    )
+
+    http_client.async_post.assert_awaited_once()
+    args, kwargs = http_client.async_post.call_args
+    assert args[0] == "v2/sendsms"
+    assert kwargs["api_version"] == "v2"
+
+    payload = kwargs["json_data"]
+    assert payload["mobiles"] == "919999999999,918888888888"
+    assert payload["message"] == "Test"
+    assert payload["sender"] == "SENDER"
+    assert payload["route"] == "4"
+
+    assert response == {"type": "success"}
+
+
+def test_async_send_template_sms():
+    """Test sending template SMS asynchronously"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.async_post.return_value = {"type": "success"}
+
+    sms = AsyncSMSResource(http_client)
+    asyncio.run(
+        sms.send_template(
+            template_id="test_template",
+            mobile="919999999999",
+            variables={"name": "Test User"},
+            short_url=False,
+        )
+    )
+
+    args, kwargs = http_client.async_post.call_args
+    assert args[0] == "flow"
+    payload = kwargs["json_data"]
+    assert payload["template_id"] == "test_template"
+    assert payload["recipients"] == [{"mobile": "919999999999", "variables": {"name": "Test User"}}]
+    assert payload["short_url"] == "0"
+
+
+def test_async_send_many_batches():
+    """Test bulk sending splits numbers into ordered batches"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.async_post.side_effect = lambda *args, **kwargs: kwargs["json_data"]
+
+    sms = AsyncSMSResource(http_client)
+    mobiles = [f"91999999{i:04d}" for i in range(5)]
+    responses = asyncio.run(
+        sms.send_many(mobiles, message="Test", sender="SENDER", batch_size=2, campaign="bulk")
+    )
+
+    assert http_client.async_post.await_count == 3
+    assert [r["mobiles"] for r in responses] == [
+        "919999990000,919999990001",
+        "919999990002,919999990003",
+        "919999990004",
+    ]
+    assert all(r["campaign"] == "bulk" for r in responses)
+
+
+def test_async_send_many_invalid_batch_size():
+    """Test bulk sending rejects an empty batch size"""
+    sms = AsyncSMSResource(create_autospec(HTTPClient, instance=True))
+
+    with pytest.raises(ValueError, match="Batch size must be at least 1"):
+        asyncio.run(sms.send_many(["919999999999"], message="Test", sender="SENDER", batch_size=0))
+
+
+def test_async_send_many_validates_before_sending():
+    """Test an invalid number anywhere in the list stops the whole send up front"""
+    http_client = create_autospec(HTTPClient, instance=True)
+
+    sms = AsyncSMSResource(http_client)
+    mobiles = [f"91999999{i:04d}" for i in range(4)] + ["bad"]
+
+    with pytest.raises(ValueError, match="Invalid mobile number: 'bad'"):
+        asyncio.run(sms.send_many(mobiles, message="Test", sender="SENDER", batch_size=2))
+
+    http_client.async_post.assert_not_called()
+
+
+def test_async_send_many_partial_failure():
+    """Test a failed batch is returned in place without discarding delivered batches"""
+    error = APIError("Server error", status=500)
+
+    def post(path, json_data, **kwargs):
+        if json_data["mobiles"].startswith("919999990002"):
+            raise error
+        return {"type": "success", "mobiles": json_data["mobiles"]}
+
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.async_post.side_effect = post
+
+    sms = AsyncSMSResource(http_client)
+    mobiles = [f"91999999{i:04d}" for i in range(5)]
+    results = asyncio.run(sms.send_many(mobiles, message="Test", sender="SENDER", batch_size=2))
+
+    assert results[0] == {"type": "success", "mobiles": "919999990000,919999990001"}
+    assert results[1] is error
+    assert results[2] == {"type": "success", "mobiles": "919999990004"}
@@ -0,0 +1,37 @@
+"""
+Tests for the TTL response cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from msg91.cache import TTLCache
+
+pytestmark = pytest.mark.unit
+
+
+@patch("msg91.cache.time.monotonic", return_value=100.0)
+def test_cache_expiry(mock_monotonic):
+    """Test entries expire after the TTL"""
+    cache = TTLCache(ttl=10)
+    cache.set("key", {"type": "success"})
+    assert cache.get("key") == {"type": "success"}
+
+    # Expired entries are kept for revalidation
+    mock_monotonic.return_value = 110.0
+    assert cache.get("key") is None
+    assert cache.get("key", stale=True) == {"type": "success"}
+
+
+def test_cache_lru_eviction():
+    """Test the least recently used entry is evicted when full"""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
@@ -2,20 +2,27 @@
 Tests for the MSG91 client
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from msg91.client import Client
 from msg91.exceptions import APIError, AuthenticationError, ValidationError
 
+pytestmark = pytest.mark.unit
+
 
 def test_client_initialization():
     """Test client initialization with proper parameters"""
     client = Client("test_auth_key")
     assert client.http_client.auth_key == "test_auth_key"
     assert client.http_client.v5_base_url == "https://control.msg91.com/api/v5"
-    assert client.http_client.v2_base_url == "http://api.msg91.com/api"
+    assert client.http_client.v2_base_url == "https://api.msg91.com/api"
 
     # Test with custom base URL
     custom_url = "https://custom.msg91.com/api"
@@ -29,52 +36,51 @@ def test_client_initialization():
 
 def test_sms_send():
     """Test SMS send functionality using standard API"""
-    # Initialize client
-    client = Client("test_auth_key")
+    captured = []
 
-    # Mock the post method
-    with patch.object(client.sms.http_client, "post") as mock_post:
-        mock_post.return_value = {"type": "success", "message": "SMS sent successfully"}
+    def handler(request):
+        captured.append(request)
+        return httpx.Response(200, json={"type": "success", "message": "SMS sent successfully"})
 
-        response = client.sms.send(
-            mobile="919XXXXXXXX", message="Test SMS message", sender="SENDER", route="4"
-        )
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
 
-        # Verify request
-        mock_post.assert_called_once()
+    response = client.sms.send(
+        mobile="919999999999", message="Test SMS message", sender="SENDER", route="4"
+    )
 
-        # Check method and URL
-        args, kwargs = mock_post.call_args
-        assert args[0] == "v2/sendsms"
-        assert kwargs["api_version"] == "v2"
+    # Check method and URL
+    (request,) = captured
+    assert request.method == "POST"
+    assert request.url == "https://api.msg91.com/api/v2/sendsms"
 
-        # Check JSON payload
-        payload = kwargs["json_data"]
-        assert payload["mobiles"] == "919XXXXXXXX"
-        assert payload["message"] == "Test SMS message"
-        assert payload["sender"] == "SENDER"
-        assert payload["route"] == "4"
-        assert payload["response"] == "json"
+    # Check JSON payload
+    payload = json.loads(request.content)
+    assert payload["mobiles"] == "919999999999"
+    assert payload["message"] == "Test SMS message"
+    assert payload["sender"] == "SENDER"
+    assert payload["route"] == "4"
+    assert payload["response"] == "json"
 
-        # Check response
-        assert response == {"type": "success", "message": "SMS sent successfully"}
+    # Check response
+    assert response == {"type": "success", "message": "SMS sent successfully"}
 
 
-@patch("httpx.Client.request")
-def test_template_create(mock_request):
+def test_template_create():
     """Test template create functionality"""
-    # Setup mock response
-    mock_response = MagicMock()
-    mock_response.is_success = True
-    mock_response.json.return_value = {
-        "type": "success",
-        "message": "Template created",
-        "data": {"id": "template_id_123"},
-    }
-    mock_request.return_value = mock_response
-
-    # Initialize client and create template
-    client = Client("test_auth_key")
+    captured = []
+
+    def handler(request):
+        captured.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "type": "success",
+                "message": "Template created",
+                "data": {"id": "template_id_123"},
+            },
+        )
+
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
     response = client.template.create(
         template_name="Test Template",
         template_body="This is a test template for {{name}}",
@@ -82,17 +88,14 @@ def test_template_create(mock_request):
         sms_type="NORMAL",
     )
 
-    # Verify request
-    mock_request.assert_called_once()
-
     # Check method, url and headers
-    args, kwargs = mock_request.call_args
-    assert args[0] == "POST"
-    assert args[1].endswith("sms/addTemplate")
-    assert kwargs["headers"]["authkey"] == "test_auth_key"
+    (request,) = captured
+    assert request.method == "POST"
+    assert request.url == "https://control.msg91.com/api/v5/sms/addTemplate"
+    assert request.headers["authkey"] == "test_auth_key"
 
     # Check JSON payload
-    payload = kwargs["json"]
+    payload = json.loads(request.content)
     assert payload["template_name"] == "Test Template"
     assert payload["template"] == "This is a test template for {{name}}"
     assert payload["sender_id"] == "SENDER"
@@ -104,88 +107,410 @@ def test_template_create(mock_request):
     assert response["data"]["id"] == "template_id_123"
 
 
-@patch("httpx.Client.request")
-def test_authentication_error(mock_request):
+def test_authentication_error():
     """Test authentication error handling"""
-    # Setup mock response
-    mock_response = MagicMock()
-    mock_response.is_success = False
-    mock_response.status_code = 401
-    mock_response.json.return_value = {"type": "error", "message": "Invalid auth key"}
-    mock_request.return_value = mock_response
-
-    # Initialize client and attempt request
     client = Client("invalid_auth_key")
+    response = httpx.Response(401, json={"type": "error", "message": "Invalid auth key"})
 
-    # Mock post to raise AuthenticationError
-    with patch.object(client.sms.http_client, "post") as mock_post:
-        mock_post.side_effect = AuthenticationError(
-            message="Invalid auth key",
-            status=401,
-            details={"type": "error", "message": "Invalid auth key"},
-        )
+    request = patch.object(client.http_client.client, "request", return_value=response)
 
-        # Verify authentication error is raised
-        with pytest.raises(AuthenticationError) as exc_info:
-            client.sms.send(mobile="919XXXXXXXX", message="Test", sender="SENDER")
+    # Verify authentication error is raised
+    with request, pytest.raises(AuthenticationError) as exc_info:
+        client.sms.send(mobile="919999999999", message="Test", sender="SENDER")
 
     assert "Invalid auth key" in str(exc_info.value)
     assert exc_info.value.status == 401
 
 
-@patch("httpx.Client.request")
-def test_validation_error(mock_request):
+def test_validation_error():
     """Test validation error handling"""
-    # Setup mock response
-    mock_response = MagicMock()
-    mock_response.is_success = False
-    mock_response.status_code = 400
-    mock_response.json.return_value = {"type": "validation", "message": "Invalid mobile number"}
-    mock_request.return_value = mock_response
-
-    # Initialize client and attempt request
     client = Client("test_auth_key")
+    response = httpx.Response(400, json={"type": "validation", "message": "Invalid mobile number"})
 
-    # Mock post to raise ValidationError
-    with patch.object(client.sms.http_client, "post") as mock_post:
-        mock_post.side_effect = ValidationError(
-            message="Invalid mobile number",
-            status=400,
-            details={"type": "validation", "message": "Invalid mobile number"},
-        )
+    request = patch.object(client.http_client.client, "request", return_value=response)
 
-        # Verify validation error is raised
-        with pytest.raises(ValidationError) as exc_info:
-            client.sms.send(mobile="invalid_mobile", message="Test", sender="SENDER")
+    # Verify validation error is raised
+    with request, pytest.raises(ValidationError) as exc_info:
+        client.sms.send(mobile="919999999999", message="Test", sender="SENDER")
 
     assert "Invalid mobile number" in str(exc_info.value)
     assert exc_info.value.status == 400
+    assert exc_info.value.details["type"] == "validation"
 
 
-@patch("httpx.Client.request")
-def test_api_error(mock_request):
+def test_api_error():
     """Test generic API error handling"""
-    # Setup mock response
-    mock_response = MagicMock()
-    mock_response.is_success = False
-    mock_response.status_code = 500
-    mock_response.json.return_value = {"type": "error", "message": "Internal server error"}
-    mock_request.return_value = mock_response
-
-    # Initialize client and attempt request
     client = Client("test_auth_key")
+    response = httpx.Response(500, json={"type": "error", "message": "Internal server error"})
 
-    # Mock post to raise APIError
-    with patch.object(client.sms.http_client, "post") as mock_post:
-        mock_post.side_effect = APIError(
-            message="Internal server error",
-            status=500,
-            details={"type": "error", "message": "Internal server error"},
-        )
+    request = patch.object(client.http_client.client, "request", return_value=response)
 
-        # Verify API error is raised
-        with pytest.raises(APIError) as exc_info:
-            client.sms.send(mobile="919XXXXXXXX", message="Test", sender="SENDER")
+    # Verify API error is raised
+    with request, pytest.raises(APIError) as exc_info:
+        client.sms.send(mobile="919999999999", message="Test", sender="SENDER")
 
     assert "Internal server error" in str(exc_info.value)
     assert exc_info.value.status == 500
+
+
+def test_client_reuses_connection_pool():
+    """Test sequential requests from different resources reuse one keep-alive connection"""
+    peers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            peers.append(self.client_address)
+            body = b'{"type":"success"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        with Client("test_auth_key", base_url=base_url) as client:
+            assert client.sms.http_client is client.template.http_client
+            client.sms.get_analytics()
+            client.template.set_default("template_id_123", "version_1")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Both requests arrived over the same TCP connection
+    assert len(peers) == 2
+    assert peers[0] == peers[1]
+
+
+def test_client_custom_limits():
+    """Test custom pool limits are passed through to httpx"""
+    limits = httpx.Limits(max_connections=5)
+    client = Client("test_auth_key", limits=limits)
+    assert client.http_client.httpx_kwargs["limits"] is limits
+
+
+def test_client_context_manager():
+    """Test client closes its connection pool on exit"""
+    with Client("test_auth_key") as client:
+        assert not client.http_client.client.is_closed
+
+    assert client.http_client.client.is_closed
+
+
+def test_async_request_error_handling():
+    """Test async requests share the sync error mapping"""
+
+    def handler(request):
+        if request.url.path.endswith("ok"):
+            return httpx.Response(200, json={"type": "success"})
+        return httpx.Response(401, json={"type": "error", "message": "Invalid auth key"})
+
+    async def run():
+        async with Client("test_auth_key", transport=httpx.MockTransport(handler)) as client:
+            response = await client.http_client.async_get("ok")
+            with pytest.raises(AuthenticationError) as exc_info:
+                await client.http_client.async_post("fail", json_data={"a": 1})
+            return client, response, exc_info
+
+    client, response, exc_info = asyncio.run(run())
+
+    assert response == {"type": "success"}
+    assert exc_info.value.status == 401
+    assert "Invalid auth key" in str(exc_info.value)
+    assert client.http_client.client.is_closed
+    assert client.http_client._async_client is None
+
+
+def test_async_client_ignores_sync_transport():
+    """Test a real sync transport is not handed to the async client"""
+
+    async def run():
+        async with Client("test_auth_key", transport=httpx.HTTPTransport(retries=2)) as client:
+            return client.http_client.async_client
+
+    async_client = asyncio.run(run())
+
+    # httpx would otherwise fail on the first request with an AttributeError
+    assert isinstance(async_client._transport, httpx.AsyncHTTPTransport)
+
+
+def test_async_httpx_kwargs():
+    """Test async-only transports and hooks are passed to the async client alone"""
+
+    def sync_hook(request):
+        pass
+
+    async def async_hook(request):
+        pass
+
+    transport = httpx.AsyncHTTPTransport(retries=2)
+    http_client = Client(
+        "test_auth_key",
+        transport=httpx.HTTPTransport(),
+        mounts={"https://": httpx.HTTPTransport()},
+        event_hooks={"request": [sync_hook]},
+        async_httpx_kwargs={"transport": transport, "event_hooks": {"request": [async_hook]}},
+    ).http_client
+
+    assert http_client.async_httpx_kwargs["transport"] is transport
+    assert http_client.async_httpx_kwargs["event_hooks"] == {"request": [async_hook]}
+    assert "mounts" not in http_client.async_httpx_kwargs
+    assert http_client.async_client._transport is transport
+
+
+def test_async_concurrency_limit():
+    """Test in-flight async requests are capped by concurrent_requests"""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"type": "success"})
+
+    async def run():
+        async with Client(
+            "test_auth_key", concurrent_requests=3, transport=httpx.MockTransport(handler)
+        ) as client:
+            return await asyncio.gather(*(client.http_client.async_get("ok") for _ in range(10)))
+
+    responses = asyncio.run(run())
+
+    assert len(responses) == 10
+    assert peak == 3
+
+
+def test_conditional_request():
+    """Test conditional requests send validators and detect 304 Not Modified"""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            json={"type": "success"},
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 02 Jan 2023 00:00:00 GMT"},
+        )
+
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
+
+    data, etag, last_modified = client.http_client.conditional_request(
+        "GET", "report/analytics/p/sms"
+    )
+    assert data == {"type": "success"}
+    assert etag == '"v1"'
+    assert last_modified == "Mon, 02 Jan 2023 00:00:00 GMT"
+    assert "If-None-Match" not in seen[0]
+
+    data, etag, _ = client.http_client.conditional_request(
+        "GET", "report/analytics/p/sms", etag='"v1"', last_modified=last_modified
+    )
+    assert data is None
+    assert etag == '"v1"'
+    assert seen[1]["If-Modified-Since"] == "Mon, 02 Jan 2023 00:00:00 GMT"
+
+    # Validators are only meaningful for GET/HEAD, so a POST is sent unconditionally
+    data, _, _ = client.http_client.conditional_request(
+        "POST", "report/logs/p/sms", etag='"v1"', last_modified=last_modified
+    )
+    assert data == {"type": "success"}
+    assert "If-None-Match" not in seen[2]
+    assert "If-Modified-Since" not in seen[2]
+
+
+@pytest.mark.parametrize(
+    "response,exception_class,message",
+    [
+        (httpx.Response(502, text="Bad Gateway"), APIError, "Unknown error"),
+        (httpx.Response(400, json=["invalid"]), ValidationError, "Unknown error"),
+        (
+            httpx.Response(422, json={"type": "Validation", "message": "Bad"}),
+            ValidationError,
+            "Bad",
+        ),
+    ],
+)
+def test_error_response_mapping(response, exception_class, message):
+    """Test error responses map to exceptions whatever their body shape"""
+    client = Client("test_auth_key", transport=httpx.MockTransport(lambda request: response))
+
+    with pytest.raises(exception_class) as exc_info:
+        client.http_client.get("report/analytics/p/sms")
+
+    assert str(exc_info.value) == message
+    assert exc_info.value.status == response.status_code
+
+
+def test_json_encoding():
+    """Test JSON bodies are pre-encoded compactly and decoded from raw bytes"""
+    captured = []
+
+    def handler(request):
+        captured.append(request)
+        return httpx.Response(200, content=b'{"type":"success","message":"\\u0928\\u092e"}')
+
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
+    response = client.http_client.post("flow", json_data={"message": "नमस्ते", "route": "4"})
+
+    assert captured[0].content == '{"message":"नमस्ते","route":"4"}'.encode()
+    assert captured[0].headers["Content-Type"] == "application/json"
+    assert response == {"type": "success", "message": "नम"}
+
+
+def test_request_headers():
+    """Test auth headers are shared and extra headers never leak between requests"""
+    http_client = Client("test_auth_key").http_client
+
+    _, headers = http_client._prepare_request("sendotp.php", None, None, "v2")
+    assert headers == {"authkey": "test_auth_key"}
+
+    _, headers = http_client._prepare_request("v2/sendsms", {"a": 1}, None, "v2")
+    assert headers == {"authkey": "test_auth_key", "Content-Type": "application/json"}
+
+    _, headers = http_client._prepare_request("flow", None, {"X-Test": "1"}, "v5")
+    assert headers["X-Test"] == "1"
+    assert headers["Content-Type"] == "application/json"
+    assert "X-Test" not in http_client._json_headers
+
+
+@pytest.mark.parametrize(
+    "path,api_version,expected_url",
+    [
+        ("sendotp.php", "v2", "https://api.msg91.com/api/sendotp.php"),
+        ("v2/sendsms", "v2", "https://api.msg91.com/api/v2/sendsms"),
+        ("flow", "v5", "https://control.msg91.com/api/v5/flow"),
+        ("/report/logs/p/sms", "v5", "https://control.msg91.com/api/v5/report/logs/p/sms"),
+    ],
+)
+def test_build_url(path, api_version, expected_url):
+    """Test API paths are appended to the versioned base URL"""
+    http_client = Client("test_auth_key").http_client
+
+    url = http_client._build_url(path, api_version)
+
+    assert url == expected_url
+    assert http_client._build_url(path, api_version) is url
+
+
+def test_build_url_unsupported_version():
+    """Test unknown API versions are rejected"""
+    with pytest.raises(ValueError, match="Unsupported API version: v3"):
+        Client("test_auth_key").http_client._build_url("flow", "v3")
+
+
+def _http2_enabled(client):
+    """Whether an httpx client's connection pool negotiates HTTP/2 (httpx exposes no public flag)"""
+    return client._transport._pool._http2
+
+
+def test_client_http2():
+    """Test HTTP/2 is enabled on both the sync and async connection pools"""
+    client = Client("test_auth_key", http2=True)
+
+    assert _http2_enabled(client.http_client.client)
+    assert _http2_enabled(client.http_client.async_client)
+
+    # HTTP/1.1 only unless asked for
+    assert not _http2_enabled(Client("test_auth_key").http_client.client)
+
+
+def _flaky_handler(failures):
+    """Build a handler that fails with the given responses before succeeding"""
+    responses = iter(failures)
+
+    def handler(request):
+        return next(responses, httpx.Response(200, json={"type": "success"}))
+
+    return handler
+
+
+@patch("msg91.http_client.time.sleep")
+def test_retry_transient_errors(mock_sleep):
+    """Test 429/5xx responses are retried with exponential backoff"""
+    handler = _flaky_handler(
+        [httpx.Response(503), httpx.Response(429, headers={"Retry-After": "3"})]
+    )
+    client = Client("test_auth_key", max_retries=2, transport=httpx.MockTransport(handler))
+
+    response = client.http_client.get("report/analytics/p/sms")
+
+    assert response == {"type": "success"}
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 3.0]
+
+
+@patch("msg91.http_client.time.sleep")
+def test_retry_delay_capped(mock_sleep):
+    """Test a long Retry-After or backoff never sleeps past max_backoff"""
+    handler = _flaky_handler(
+        [httpx.Response(429, headers={"Retry-After": "3600"}), httpx.Response(503)]
+    )
+    client = Client(
+        "test_auth_key",
+        max_retries=2,
+        backoff_factor=20,
+        max_backoff=10,
+        transport=httpx.MockTransport(handler),
+    )
+
+    response = client.http_client.get("report/analytics/p/sms")
+
+    assert response == {"type": "success"}
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [10.0, 10.0]
+
+
+@patch("msg91.http_client.time.sleep")
+def test_retry_exhausted(mock_sleep):
+    """Test the last error is raised once retries run out"""
+    handler = _flaky_handler([httpx.Response(502, json={"message": "Bad gateway"})] * 3)
+    client = Client("test_auth_key", max_retries=1, transport=httpx.MockTransport(handler))
+
+    with pytest.raises(APIError, match="Bad gateway") as exc_info:
+        client.http_client.get("report/analytics/p/sms")
+
+    assert exc_info.value.status == 502
+    mock_sleep.assert_called_once_with(0.5)
+
+
+@patch("msg91.http_client.time.sleep")
+def test_no_retry_by_default(mock_sleep):
+    """Test retries are disabled unless max_retries is set"""
+    handler = _flaky_handler([httpx.Response(503)])
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
+
+    with pytest.raises(APIError):
+        client.http_client.get("report/analytics/p/sms")
+
+    mock_sleep.assert_not_called()
+
+
+def test_async_retry():
+    """Test async retries wait with asyncio.sleep"""
+    handler = _flaky_handler([httpx.Response(504), httpx.Response(504)])
+
+    async def run():
+        async with Client(
+            "test_auth_key",
+            max_retries=2,
+            backoff_factor=0.1,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.http_client.async_get("report/analytics/p/sms")
+
+    with patch("msg91.http_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = asyncio.run(run())
+
+    assert response == {"type": "success"}
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [0.1, 0.2]
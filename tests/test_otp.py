@@ -2,210 +2,209 @@
 Tests for OTP Resource
 """
 
+import json
+from types import MappingProxyType
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from msg91 import Client
-from msg91.exceptions import APIError, AuthenticationError, ValidationError
-
-
-@pytest.fixture
-def client():
-    """Create a test client"""
-    return Client("test_auth_key")
-
-
-def test_send_otp_basic(client):
-    """Test basic OTP sending"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        # Mock successful response
-        mock_get.return_value = {"type": "success", "message": "3763646c3058373530393938"}
-
-        response = client.otp.send(mobile="919999999999")
-
-        # Verify request was made correctly
-        mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        assert args[0] == "sendotp.php"
-        assert kwargs["api_version"] == "v2"
-        params = kwargs["params"]
-        assert params["mobile"] == "919999999999"
-
-        # Verify response
-        assert response["type"] == "success"
-        assert "message" in response
-
-
-def test_send_otp_with_options(client):
-    """Test OTP sending with all options"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.return_value = {"type": "success", "message": "session_id"}
-
-        response = client.otp.send(
-            mobile="919999999999",
-            message="Your OTP is ##OTP##",
-            sender="MYAPP",
-            otp="1234",
-            otp_expiry=5,
-            otp_length=6,
-        )
-
-        # Verify request parameters
-        args, kwargs = mock_get.call_args
-        params = kwargs["params"]
-        assert params["mobile"] == "919999999999"
-        assert params["message"] == "Your OTP is ##OTP##"
-        assert params["sender"] == "MYAPP"
-        assert params["otp"] == "1234"
-        assert params["otp_expiry"] == 5
-        assert params["otp_length"] == 6
-
-        assert response["type"] == "success"
-
-
-def test_send_otp_invalid_length(client):
-    """Test OTP sending with invalid length"""
+from msg91.exceptions import APIError, AuthenticationError, MSG91Exception, ValidationError
+
+pytestmark = pytest.mark.unit
+
+MOBILE = "919999999999"
+
+URL_SEND = "https://api.msg91.com/api/sendotp.php"
+URL_VERIFY = "https://api.msg91.com/api/verifyRequestOTP.php"
+URL_RESEND = "https://api.msg91.com/api/retryotp.php"
+
+# Expected query strings, built once and frozen; authkey travels in a header, not here
+EXPECTED_BASIC_PARAMS = MappingProxyType({"mobile": MOBILE})
+EXPECTED_OPTION_PARAMS = MappingProxyType(
+    {
+        "mobile": MOBILE,
+        "message": "Your OTP is ##OTP##",
+        "sender": "MYAPP",
+        "otp": "1234",
+        "otp_expiry": "5",
+        "otp_length": "6",
+    }
+)
+EXPECTED_VERIFY_PARAMS = MappingProxyType({"mobile": MOBILE, "otp": "1234"})
+EXPECTED_RESEND_TEXT_PARAMS = MappingProxyType({"mobile": MOBILE, "retrytype": "text"})
+EXPECTED_RESEND_VOICE_PARAMS = MappingProxyType({"mobile": MOBILE, "retrytype": "voice"})
+
+# Success reply, serialised once and shared by every request the transport answers
+SUCCESS_JSON = MappingProxyType({"type": "success", "message": "ok"})
+SUCCESS_BODY = json.dumps(dict(SUCCESS_JSON), separators=(",", ":")).encode()
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+def _success(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=SUCCESS_BODY, headers=JSON_HEADERS)
+
+
+@pytest.fixture(scope="module")
+def transport():
+    """In-process transport standing in for the MSG91 API"""
+    return httpx.MockTransport(_success)
+
+
+@pytest.fixture(scope="module")
+def client(transport):
+    """Create one test client shared by the module, wired to the mock transport"""
+    with Client("test_auth_key", transport=transport) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def sent(transport):
+    """Reset the transport to a success reply and record the requests of one test"""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return _success(request)
+
+    transport.handler = handler
+    return sent
+
+
+@pytest.mark.parametrize(
+    "method,kwargs,expected_url,expected_params",
+    [
+        ("send", {"mobile": MOBILE}, URL_SEND, EXPECTED_BASIC_PARAMS),
+        (
+            "send",
+            {
+                "mobile": MOBILE,
+                "message": "Your OTP is ##OTP##",
+                "sender": "MYAPP",
+                "otp": "1234",
+                "otp_expiry": 5,
+                "otp_length": 6,
+            },
+            URL_SEND,
+            EXPECTED_OPTION_PARAMS,
+        ),
+        (
+            "verify",
+            {"mobile": MOBILE, "otp": "1234"},
+            URL_VERIFY,
+            EXPECTED_VERIFY_PARAMS,
+        ),
+        (
+            "resend",
+            {"mobile": MOBILE, "retrytype": "text"},
+            URL_RESEND,
+            EXPECTED_RESEND_TEXT_PARAMS,
+        ),
+        (
+            "resend",
+            {"mobile": MOBILE, "retrytype": "voice"},
+            URL_RESEND,
+            EXPECTED_RESEND_VOICE_PARAMS,
+        ),
+    ],
+)
+def test_otp_request(client, sent, method, kwargs, expected_url, expected_params):
+    """Test send, verify and resend build the expected v2 request"""
+    response = getattr(client.otp, method)(**kwargs)
+
+    (request,) = sent
+    assert request.method == "GET"
+    assert request.url.copy_with(query=None) == expected_url
+    assert dict(request.url.params) == expected_params
+    assert request.headers["authkey"] == "test_auth_key"
+    assert response == SUCCESS_JSON
+
+
+@pytest.mark.parametrize("bad_len", [0, 3, 10])
+def test_send_otp_invalid_length(client, sent, bad_len):
+    """Test OTP sending with invalid length fails before any request is built"""
     with pytest.raises(ValueError, match="OTP length must be between 4 and 9"):
-        client.otp.send(mobile="919999999999", otp_length=3)
-
-    with pytest.raises(ValueError, match="OTP length must be between 4 and 9"):
-        client.otp.send(mobile="919999999999", otp_length=10)
-
-
-def test_verify_otp(client):
-    """Test OTP verification"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.return_value = {
-            "type": "success",
-            "message": "OTP verified successfully",
-        }
+        client.otp.send(mobile=MOBILE, otp_length=bad_len)
 
-        response = client.otp.verify(mobile="919999999999", otp="1234")
+    assert sent == []
 
-        # Verify request was made correctly
-        mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        assert args[0] == "verifyRequestOTP.php"
-        assert kwargs["api_version"] == "v2"
-        params = kwargs["params"]
-        assert params["mobile"] == "919999999999"
-        assert params["otp"] == "1234"
 
-        assert response["type"] == "success"
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [
+        ("send", {"mobile": "+919999999999"}),
+        ("verify", {"mobile": "9999", "otp": "1234"}),
+        ("resend", {"mobile": "91999999999a"}),
+        ("send", {"mobile": "919999999999\n"}),
+        ("send", {"mobile": "\u0669" * 12}),
+    ],
+)
+def test_otp_invalid_mobile(client, sent, method, kwargs):
+    """Test malformed mobile numbers are rejected without a request"""
+    with pytest.raises(ValueError, match="Invalid mobile number"):
+        getattr(client.otp, method)(**kwargs)
 
+    assert sent == []
 
-def test_resend_otp_text(client):
-    """Test OTP resending via text"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.return_value = {"type": "success", "message": "OTP resent successfully"}
 
-        response = client.otp.resend(mobile="919999999999", retrytype="text")
+def _make_error(status: int, message: str):
+    """Build a transport handler that answers every request with an MSG91 error body"""
+    return lambda request: httpx.Response(status, json={"type": "error", "message": message})
 
-        # Verify request was made correctly
-        mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        assert args[0] == "retryotp.php"
-        assert kwargs["api_version"] == "v2"
-        params = kwargs["params"]
-        assert params["mobile"] == "919999999999"
-        assert params["retrytype"] == "text"
 
-        assert response["type"] == "success"
+@pytest.mark.parametrize(
+    "method,kwargs,status,exception_class,message",
+    [
+        ("send", {"mobile": MOBILE}, 401, AuthenticationError, "Invalid authentication key"),
+        ("verify", {"mobile": MOBILE, "otp": "wrong"}, 400, ValidationError, "Invalid OTP"),
+        ("resend", {"mobile": MOBILE}, 500, APIError, "Server error"),
+    ],
+)
+def test_otp_error(client, transport, method, kwargs, status, exception_class, message):
+    """Test OTP error responses raise the matching exception"""
+    transport.handler = _make_error(status, message)
 
+    with pytest.raises(exception_class) as exc_info:
+        getattr(client.otp, method)(**kwargs)
 
-def test_resend_otp_voice(client):
-    """Test OTP resending via voice"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.return_value = {"type": "success", "message": "OTP resent via voice"}
+    assert exc_info.value.status == status
+    assert message in str(exc_info.value)
 
-        response = client.otp.resend(mobile="919999999999", retrytype="voice")
 
-        # Verify request was made correctly
-        args, kwargs = mock_get.call_args
-        params = kwargs["params"]
-        assert params["retrytype"] == "voice"
+@patch("msg91.http_client.time.sleep")
+def test_send_otp_network_error(mock_sleep, client, transport, sent):
+    """Test OTP send wraps a transport failure once, without retrying or sleeping"""
 
-        assert response["type"] == "success"
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        raise httpx.ConnectError("Connection failed", request=request)
 
+    transport.handler = handler
 
-def test_send_otp_authentication_error(client):
-    """Test OTP send with authentication error"""
+    with pytest.raises(MSG91Exception, match="^Network error: Connection failed$") as exc_info:
+        client.otp.send(mobile="919999999999")
 
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.side_effect = AuthenticationError(
-            message="Invalid authentication key",
-            status=401,
-            details={"type": "error", "message": "Invalid authentication key"},
-        )
+    assert type(exc_info.value) is MSG91Exception
+    assert isinstance(exc_info.value.__cause__, httpx.ConnectError)
+    assert len(sent) == 1
+    mock_sleep.assert_not_called()
 
-        with pytest.raises(AuthenticationError) as exc_info:
-            client.otp.send(mobile="919999999999")
 
-        assert exc_info.value.status == 401
-        assert "Invalid authentication key" in str(exc_info.value)
-
-
-def test_verify_otp_validation_error(client):
-    """Test OTP verify with validation error"""
-
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.side_effect = ValidationError(
-            message="Invalid OTP", status=400, details={"type": "error", "message": "Invalid OTP"}
-        )
-
-        with pytest.raises(ValidationError) as exc_info:
-            client.otp.verify(mobile="919999999999", otp="wrong")
-
-        assert exc_info.value.status == 400
-        assert "Invalid OTP" in str(exc_info.value)
-
-
-def test_resend_otp_api_error(client):
-    """Test OTP resend with API error"""
-
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.side_effect = APIError(
-            message="Server error", status=500, details={"type": "error", "message": "Server error"}
-        )
-
-        with pytest.raises(APIError) as exc_info:
-            client.otp.resend(mobile="919999999999")
-
-        assert exc_info.value.status == 500
-        assert "Server error" in str(exc_info.value)
-
-
-def test_send_otp_network_error(client):
-    """Test OTP send with network error"""
-    from msg91.exceptions import MSG91Exception
-
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.side_effect = MSG91Exception("Network error: Connection failed")
-
-        with pytest.raises(MSG91Exception, match="Network error"):
-            client.otp.send(mobile="919999999999")
-
-
-def test_send_otp_invalid_json_response(client):
+def test_send_otp_invalid_json_response(client, transport):
     """Test OTP send with invalid JSON response"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.return_value = {"raw_content": "Invalid response"}
+    transport.handler = lambda request: httpx.Response(200, text="Invalid response")
 
-        response = client.otp.send(mobile="919999999999")
+    response = client.otp.send(mobile="919999999999")
 
-        assert response["raw_content"] == "Invalid response"
+    assert response["raw_content"] == "Invalid response"
 
 
-def test_otp_additional_kwargs(client):
+def test_otp_additional_kwargs(client, sent):
     """Test OTP methods with additional kwargs"""
-    with patch.object(client.otp.http_client, "get") as mock_get:
-        mock_get.return_value = {"type": "success"}
-
-        # Test send with additional parameters
-        client.otp.send(mobile="919999999999", extra_param="value", another_param="another_value")
+    # Test send with additional parameters
+    client.otp.send(mobile="919999999999", extra_param="value", another_param="another_value")
 
-        args, kwargs = mock_get.call_args
-        params = kwargs["params"]
-        assert params["extra_param"] == "value"
-        assert params["another_param"] == "another_value"
+    params = sent[0].url.params
+    assert params["extra_param"] == "value"
+    assert params["another_param"] == "another_value"
@@ -0,0 +1,74 @@
+"""
+Tests for the token bucket rate limiter
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from msg91 import Client
+from msg91.rate_limit import RateLimiter
+
+pytestmark = pytest.mark.unit
+
+
+def test_rate_limiter_invalid_rate():
+    """Test rate limiter rejects non-positive quotas"""
+    with pytest.raises(ValueError, match="Rate limit must be positive"):
+        RateLimiter(0)
+
+    with pytest.raises(ValueError, match="Rate limit must be positive"):
+        RateLimiter(10, per=0)
+
+
+@patch("msg91.rate_limit.time.sleep")
+@patch("msg91.rate_limit.time.monotonic", return_value=100.0)
+def test_rate_limiter_burst_then_paced(mock_monotonic, mock_sleep):
+    """Test a full bucket allows a burst, then paces further requests"""
+    limiter = RateLimiter(2, per=1.0)
+
+    limiter.acquire()
+    limiter.acquire()
+    mock_sleep.assert_not_called()
+
+    limiter.acquire()
+    mock_sleep.assert_called_once_with(0.5)
+
+    # Tokens refill as time passes
+    mock_monotonic.return_value = 102.0
+    mock_sleep.reset_mock()
+    limiter.acquire()
+    mock_sleep.assert_not_called()
+
+
+@patch("msg91.rate_limit.asyncio.sleep", new_callable=AsyncMock)
+@patch("msg91.rate_limit.time.monotonic", return_value=100.0)
+def test_rate_limiter_async(mock_monotonic, mock_sleep):
+    """Test the async limiter waits with asyncio.sleep"""
+    limiter = RateLimiter(1, per=2.0)
+
+    async def run():
+        await limiter.acquire_async()
+        await limiter.acquire_async()
+
+    asyncio.run(run())
+
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+def test_client_rate_limit():
+    """Test the client acquires a token before each request"""
+    client = Client("test_auth_key", rate_limit=(5, 1.0))
+    assert client.http_client.rate_limiter.rate == 5
+    assert client.http_client.rate_limiter.per == 1.0
+
+    with patch.object(client.http_client.rate_limiter, "acquire") as mock_acquire:
+        with patch.object(client.http_client.client, "request") as mock_request:
+            mock_request.return_value = httpx.Response(200, json={"type": "success"})
+
+            client.otp.send(mobile="919999999999")
+
+    mock_acquire.assert_called_once()
+    assert Client("test_auth_key").http_client.rate_limiter is None
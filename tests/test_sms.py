@@ -2,62 +2,64 @@
 Tests for the SMS resource
 """
 
-from unittest.mock import MagicMock
+import json
+from unittest.mock import create_autospec, patch
 
-from msg91.resources.sms import SMSResource
+import httpx
+import pytest
+
+from msg91 import Client
+from msg91.http_client import HTTPClient
+from msg91.resources.sms import SMSResource, _format_recipients
+
+pytestmark = pytest.mark.unit
 
 
 def test_format_recipients_single():
     """Test formatting a single recipient"""
-    http_client = MagicMock()
-    sms = SMSResource(http_client)
-
     # Test with single mobile number
-    recipients = sms._format_recipients("9199XXXXXXXX")
+    recipients = _format_recipients("919999999999")
     assert len(recipients) == 1
-    assert recipients[0]["mobile"] == "9199XXXXXXXX"
+    assert recipients[0]["mobile"] == "919999999999"
     assert "variables" not in recipients[0]
 
     # Test with single mobile number and variables
     variables = {"name": "Test User", "otp": "1234"}
-    recipients = sms._format_recipients("9199XXXXXXXX", variables)
+    recipients = _format_recipients("919999999999", variables)
     assert len(recipients) == 1
-    assert recipients[0]["mobile"] == "9199XXXXXXXX"
+    assert recipients[0]["mobile"] == "919999999999"
     assert recipients[0]["variables"] == variables
 
 
 def test_format_recipients_multiple():
     """Test formatting multiple recipients"""
-    http_client = MagicMock()
-    sms = SMSResource(http_client)
-
     # Test with multiple mobile numbers
-    recipients = sms._format_recipients(["9199XXXXXXXX", "9198XXXXXXXX"])
+    recipients = _format_recipients(["919999999999", "919888888888"])
     assert len(recipients) == 2
-    assert recipients[0]["mobile"] == "9199XXXXXXXX"
-    assert recipients[1]["mobile"] == "9198XXXXXXXX"
+    assert recipients[0]["mobile"] == "919999999999"
+    assert recipients[1]["mobile"] == "919888888888"
 
     # Test with multiple mobile numbers and variables
     variables = {"name": "Test User", "otp": "1234"}
-    recipients = sms._format_recipients(["9199XXXXXXXX", "9198XXXXXXXX"], variables)
+    recipients = _format_recipients(["919999999999", "919888888888"], variables)
     assert len(recipients) == 2
-    assert recipients[0]["mobile"] == "9199XXXXXXXX"
+    assert recipients[0]["mobile"] == "919999999999"
     assert recipients[0]["variables"] == variables
-    assert recipients[1]["mobile"] == "9198XXXXXXXX"
+    assert recipients[1]["mobile"] == "919888888888"
     assert recipients[1]["variables"] == variables
 
 
 def test_send_sms():
     """Test sending SMS using standard API"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.post.return_value = {"type": "success", "message": "SMS sent successfully"}
 
     # Create SMS resource
     sms = SMSResource(http_client)
 
     response = sms.send(
-        mobile="919XXXXXXXX",
+        mobile="919999999999",
         message="Test SMS message",
         sender="SENDER",
         route="4",
@@ -72,7 +74,7 @@ def test_send_sms():
 
     # Check payload
     payload = kwargs.get("json_data", {})
-    assert payload["mobiles"] == "919XXXXXXXX"
+    assert payload["mobiles"] == "919999999999"
     assert payload["message"] == "Test SMS message"
     assert payload["sender"] == "SENDER"
     assert payload["route"] == "4"
@@ -86,14 +88,14 @@ def test_send_sms():
 def test_send_template_sms():
     """Test sending SMS using template (Flow API)"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.post.return_value = {"type": "success", "message": "SMS sent successfully"}
 
     # Create SMS resource and send SMS
     sms = SMSResource(http_client)
     response = sms.send_template(
         template_id="test_template",
-        mobile="919XXXXXXXX",
+        mobile="919999999999",
         variables={"name": "Test User"},
         sender_id="SENDER",
         short_url=True,
@@ -108,7 +110,7 @@ def test_send_template_sms():
     payload = kwargs.get("json_data", {})
     assert payload["template_id"] == "test_template"
     assert len(payload["recipients"]) == 1
-    assert payload["recipients"][0]["mobile"] == "919XXXXXXXX"
+    assert payload["recipients"][0]["mobile"] == "919999999999"
     assert payload["recipients"][0]["variables"] == {"name": "Test User"}
     assert payload["sender"] == "SENDER"
     assert payload["short_url"] == "1"
@@ -120,7 +122,7 @@ def test_send_template_sms():
 def test_get_logs():
     """Test getting SMS logs"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.post.return_value = {"type": "success", "data": []}
 
     # Create SMS resource and get logs
@@ -144,7 +146,7 @@ def test_get_logs():
 def test_get_analytics():
     """Test getting SMS analytics"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.get.return_value = {
         "type": "success",
         "data": {"total_sent": 100, "delivered": 90, "failed": 10},
@@ -169,3 +171,225 @@ def test_get_analytics():
     assert response["data"]["total_sent"] == 100
     assert response["data"]["delivered"] == 90
     assert response["data"]["failed"] == 10
+
+
+def test_report_cache():
+    """Test identical log and analytics queries are served from the cache"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.CONDITIONAL_METHODS = HTTPClient.CONDITIONAL_METHODS
+    http_client.request.return_value = {"type": "success", "data": []}
+    http_client.conditional_request.return_value = ({"type": "success", "data": []}, None, None)
+
+    sms = SMSResource(http_client, cache_ttl=60)
+
+    first = sms.get_logs(start_date="2023-01-01", end_date="2023-01-31")
+    second = sms.get_logs(start_date="2023-01-01", end_date="2023-01-31")
+    assert first == second
+    assert first is not second
+
+    # Mutating a result leaves the cached copy untouched
+    first["data"].append("changed")
+    assert sms.get_logs(start_date="2023-01-01", end_date="2023-01-31")["data"] == []
+    http_client.request.assert_called_once_with(
+        "POST",
+        "report/logs/p/sms",
+        params=None,
+        json_data={"start_date": "2023-01-01", "end_date": "2023-01-31"},
+    )
+
+    # Different filters are cached separately
+    sms.get_logs(start_date="2023-02-01", end_date="2023-02-28")
+    assert http_client.request.call_count == 2
+
+    sms.get_analytics(start_date="2023-01-01")
+    sms.get_analytics(start_date="2023-01-01")
+    assert http_client.conditional_request.call_count == 1
+
+    # Invalidation forces a fresh request
+    sms.invalidate_cache()
+    sms.get_analytics(start_date="2023-01-01")
+    assert http_client.conditional_request.call_count == 2
+
+
+@patch("msg91.cache.time.monotonic", return_value=100.0)
+def test_report_cache_revalidation(mock_monotonic):
+    """Test expired entries are revalidated and reused on 304 Not Modified"""
+    data = {"type": "success", "data": {"total_sent": 100}}
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.CONDITIONAL_METHODS = HTTPClient.CONDITIONAL_METHODS
+    http_client.conditional_request.return_value = (data, '"v1"', "Mon, 02 Jan 2023 00:00:00 GMT")
+
+    sms = SMSResource(http_client, cache_ttl=60)
+    sms.get_analytics(start_date="2023-01-01")
+
+    # Expire the entry; the server reports it unchanged
+    mock_monotonic.return_value = 200.0
+    http_client.conditional_request.return_value = (None, None, None)
+    response = sms.get_analytics(start_date="2023-01-01")
+
+    assert response == data
+    assert response is not data
+    kwargs = http_client.conditional_request.call_args.kwargs
+    assert kwargs["etag"] == '"v1"'
+    assert kwargs["last_modified"] == "Mon, 02 Jan 2023 00:00:00 GMT"
+
+    # The revalidated entry is fresh again and keeps its validators
+    sms.get_analytics(start_date="2023-01-01")
+    assert http_client.conditional_request.call_count == 2
+
+
+@patch("msg91.cache.time.monotonic", return_value=100.0)
+def test_report_cache_logs_refetch(mock_monotonic):
+    """Test expired log entries are re-fetched without conditional headers"""
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        if "If-None-Match" in request.headers:
+            # A compliant server refuses a matching precondition on POST
+            return httpx.Response(412, json={"type": "error", "message": "Precondition Failed"})
+        return httpx.Response(200, json={"type": "success", "data": []}, headers={"ETag": '"v1"'})
+
+    client = Client("test_auth_key", cache_ttl=60, transport=httpx.MockTransport(handler))
+    client.sms.get_logs(start_date="2023-01-01")
+
+    mock_monotonic.return_value = 200.0
+    response = client.sms.get_logs(start_date="2023-01-01")
+
+    assert response == {"type": "success", "data": []}
+    assert len(seen) == 2
+    assert "If-None-Match" not in seen[1].headers
+    assert "If-Modified-Since" not in seen[1].headers
+
+
+def test_report_cache_unhashable_kwargs():
+    """Test queries with unhashable filters bypass the cache"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.request.return_value = {"type": "success", "data": []}
+
+    sms = SMSResource(http_client, cache_ttl=60)
+    sms.get_logs(start_date="2023-01-01", status=["delivered"])
+    sms.get_logs(start_date="2023-01-01", status=["delivered"])
+
+    assert http_client.request.call_count == 2
+    http_client.conditional_request.assert_not_called()
+
+
+def test_report_cache_disabled_by_default():
+    """Test caching is opt-in"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    http_client.post.return_value = {"type": "success", "data": []}
+
+    sms = SMSResource(http_client)
+    sms.get_logs(start_date="2023-01-01")
+    sms.get_logs(start_date="2023-01-01")
+
+    assert http_client.post.call_count == 2
+
+
+def test_send_sms_options():
+    """Test optional SMS settings are encoded and unset ones omitted"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    sms = SMSResource(http_client)
+
+    sms.send(
+        mobile=["919999999999", "918888888888"],
+        message="Test",
+        sender="SENDER",
+        flash=False,
+        unicode=True,
+        scheduled_datetime="2023-01-01 10:00:00",
+        campaign="",
+        extra_param="value",
+    )
+
+    payload = http_client.post.call_args.kwargs["json_data"]
+    assert payload == {
+        "mobiles": "919999999999,918888888888",
+        "message": "Test",
+        "sender": "SENDER",
+        "route": "4",
+        "response": "json",
+        "flash": "0",
+        "unicode": "1",
+        "scheduledatetime": "2023-01-01 10:00:00",
+        "extra_param": "value",
+    }
+
+
+def test_send_sms_invalid_mobile():
+    """Test malformed mobile numbers are rejected without a request"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    sms = SMSResource(http_client)
+
+    with pytest.raises(ValueError, match="Invalid mobile number: '91-9999'"):
+        sms.send(mobile=["919999999999", "91-9999"], message="Test", sender="SENDER")
+
+    with pytest.raises(ValueError, match="Invalid mobile number"):
+        sms.send_template(template_id="test_template", mobile="")
+
+    # Trailing newlines and non-ASCII digits (here Arabic-Indic) are not valid numbers
+    with pytest.raises(ValueError, match="Invalid mobile number"):
+        sms.send(mobile="919999999999\n", message="Test", sender="SENDER")
+
+    with pytest.raises(ValueError, match="Invalid mobile number"):
+        sms.send(mobile="\u0669" * 12, message="Test", sender="SENDER")
+
+    # Empty lists and non-string numbers are rejected with the same error
+    with pytest.raises(ValueError, match=r"Invalid mobile number: \[\]"):
+        sms.send(mobile=[], message="Test", sender="SENDER")
+
+    with pytest.raises(ValueError, match="Invalid mobile number: 919999999999"):
+        sms.send(mobile=919999999999, message="Test", sender="SENDER")
+
+    with pytest.raises(ValueError, match="Invalid mobile number: '91-9999'"):
+        sms.send(mobile="919999999999,91-9999", message="Test", sender="SENDER")
+
+    http_client.post.assert_not_called()
+
+
+def test_send_sms_comma_separated_string():
+    """Test a comma-separated string of numbers is still accepted by send"""
+    http_client = create_autospec(HTTPClient, instance=True)
+    sms = SMSResource(http_client)
+
+    sms.send(mobile="919999999999,918888888888", message="Test", sender="SENDER")
+
+    payload = http_client.post.call_args.kwargs["json_data"]
+    assert payload["mobiles"] == "919999999999,918888888888"
+
+
+def test_send_bulk_sms_body():
+    """Test a large bulk send is encoded once into a single request body"""
+    captured = []
+
+    def handler(request):
+        captured.append(request)
+        return httpx.Response(200, json={"type": "success"})
+
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
+    mobiles = [f"91{i:010d}" for i in range(10000)]
+    client.sms.send(mobile=mobiles, message="Test", sender="SENDER")
+
+    assert len(captured) == 1
+    body = json.loads(captured[0].content)
+    assert body["mobiles"] == ",".join(mobiles)
+
+    # Pre-encoded bytes are sent with a fixed length rather than chunked
+    assert captured[0].headers["Content-Length"] == str(len(captured[0].content))
+    assert "Transfer-Encoding" not in captured[0].headers
+
+
+def test_send_sms_authkey_header_only():
+    """Test the auth key is sent as a header and not repeated in the body"""
+    captured = []
+
+    def handler(request):
+        captured.append(request)
+        return httpx.Response(200, json={"type": "success"})
+
+    client = Client("test_auth_key", transport=httpx.MockTransport(handler))
+    client.sms.send(mobile="919999999999", message="Test", sender="SENDER")
+
+    assert captured[0].headers["authkey"] == "test_auth_key"
+    assert "authkey" not in json.loads(captured[0].content)
@@ -2,15 +2,20 @@
 Tests for the Template resource
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import create_autospec
 
+import pytest
+
+from msg91.http_client import HTTPClient
 from msg91.resources.template import TemplateResource
 
+pytestmark = pytest.mark.unit
+
 
 def test_create_template():
     """Test creating a template"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.post.return_value = {
         "type": "success",
         "message": "Template created successfully",
@@ -47,7 +52,7 @@ def test_create_template():
 def test_add_template_version():
     """Test adding a new version to a template"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.post.return_value = {
         "type": "success",
         "message": "Template version added successfully",
@@ -82,7 +87,7 @@ def test_add_template_version():
 def test_get_template_versions():
     """Test getting template versions"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.post.return_value = {
         "type": "success",
         "data": [
@@ -114,7 +119,7 @@ def test_get_template_versions():
 def test_set_default_template():
     """Test setting a template version as default"""
     # Mock HTTP client
-    http_client = MagicMock()
+    http_client = create_autospec(HTTPClient, instance=True)
     http_client.get.return_value = {"type": "success", "message": "Template version set as default"}
 
     # Create Template resource and set default